@@ -1,14 +1,23 @@
 """TinyHTML - a simple HTML generator for Python."""
 
 from collections.abc import Callable, Iterable
-from enum import StrEnum, auto
-from typing import Self
+from types import GeneratorType
+from typing import Final, Protocol, Self, cast
 
 # Types - using Python 3.14's native forward refs and union operator
 type Primitive = str | bytes | int | float | Element
-type Content = Primitive | Iterable[Content]
+type Content = Primitive | Slot | Iterable[Content]
 type Attr = str | int | float | bool | None | dict[str, str]
 
+
+class Writable(Protocol):
+    """Anything with a text write method, e.g. StringIO or an open file."""
+
+    def write(self, s: str, /) -> object:
+        """Write a string fragment."""
+        ...
+
+
 # HTML specification constants
 DEFAULT_ATTRS = {
     "script": {"type": "text/javascript"},
@@ -18,100 +27,284 @@ DEFAULT_ATTRS = {
 }
 
 
-class Tag(StrEnum):
-    """Pre-defined HTML tags."""
-
-    DOCTYPE = auto()
-    HTML = auto()
-    HEAD = auto()
-    BODY = auto()
-    TITLE = auto()
-    META = auto()
-    LINK = auto()
-    STYLE = auto()
-    SCRIPT = auto()
-    HEADER = auto()
-    NAV = auto()
-    MAIN = auto()
-    ARTICLE = auto()
-    SECTION = auto()
-    ASIDE = auto()
-    FOOTER = auto()
-    DIV = auto()
-    P = auto()
-    HR = auto()
-    PRE = auto()
-    CODE = auto()
-    BLOCKQUOTE = auto()
-    SPAN = auto()
-    A = auto()
-    STRONG = auto()
-    EM = auto()
-    I = auto()  # noqa: E741
-    B = auto()
-    U = auto()
-    SUB = auto()
-    SUP = auto()
-    BR = auto()
-    UL = auto()
-    OL = auto()
-    LI = auto()
-    DL = auto()
-    DT = auto()
-    DD = auto()
-    TABLE = auto()
-    CAPTION = auto()
-    THEAD = auto()
-    TBODY = auto()
-    TFOOT = auto()
-    TR = auto()
-    TH = auto()
-    TD = auto()
-    FORM = auto()
-    LABEL = auto()
-    INPUT = auto()
-    BUTTON = auto()
-    SELECT = auto()
-    OPTION = auto()
-    TEXTAREA = auto()
-    IMG = auto()
-    AUDIO = auto()
-    VIDEO = auto()
-    SOURCE = auto()
-    CANVAS = auto()
+# Default attrs as tuples of pairs, fetched with one .get per construction
+_DEFAULTS_PAIRS = {k: tuple(v.items()) for k, v in DEFAULT_ATTRS.items()}
+
+# Exact leaf types, checked by identity before any slower isinstance fallback
+_PRIM_TYPES = frozenset({str, bytes, int, float})
+
+# Common exact container types; the Iterable ABC walk only runs on a miss
+_ITERABLE_TYPES = frozenset({tuple, list, GeneratorType})
+
+
+class Tag:
+    """Pre-defined HTML tag names as plain string constants.
+
+    Plain interned strings hash and format without the StrEnum value
+    indirection previously paid on every construction and render.
+    """
+
+    DOCTYPE: Final = "doctype"
+    HTML: Final = "html"
+    HEAD: Final = "head"
+    BODY: Final = "body"
+    TITLE: Final = "title"
+    META: Final = "meta"
+    LINK: Final = "link"
+    STYLE: Final = "style"
+    SCRIPT: Final = "script"
+    HEADER: Final = "header"
+    NAV: Final = "nav"
+    MAIN: Final = "main"
+    ARTICLE: Final = "article"
+    SECTION: Final = "section"
+    ASIDE: Final = "aside"
+    FOOTER: Final = "footer"
+    DIV: Final = "div"
+    P: Final = "p"
+    HR: Final = "hr"
+    PRE: Final = "pre"
+    CODE: Final = "code"
+    BLOCKQUOTE: Final = "blockquote"
+    SPAN: Final = "span"
+    A: Final = "a"
+    STRONG: Final = "strong"
+    EM: Final = "em"
+    I: Final = "i"  # noqa: E741
+    B: Final = "b"
+    U: Final = "u"
+    SUB: Final = "sub"
+    SUP: Final = "sup"
+    BR: Final = "br"
+    UL: Final = "ul"
+    OL: Final = "ol"
+    LI: Final = "li"
+    DL: Final = "dl"
+    DT: Final = "dt"
+    DD: Final = "dd"
+    TABLE: Final = "table"
+    CAPTION: Final = "caption"
+    THEAD: Final = "thead"
+    TBODY: Final = "tbody"
+    TFOOT: Final = "tfoot"
+    TR: Final = "tr"
+    TH: Final = "th"
+    TD: Final = "td"
+    FORM: Final = "form"
+    LABEL: Final = "label"
+    INPUT: Final = "input"
+    BUTTON: Final = "button"
+    SELECT: Final = "select"
+    OPTION: Final = "option"
+    TEXTAREA: Final = "textarea"
+    IMG: Final = "img"
+    AUDIO: Final = "audio"
+    VIDEO: Final = "video"
+    SOURCE: Final = "source"
+    CANVAS: Final = "canvas"
+
+
+# Tags rendered as void by the pre-defined elements below
+_VOID_TAGS = frozenset(
+    {Tag.META, Tag.LINK, Tag.HR, Tag.BR, Tag.INPUT, Tag.IMG, Tag.SOURCE},
+)
+
+# Tags rendered with preserved whitespace by the pre-defined elements below
+_PRESERVE_TAGS = frozenset(
+    {Tag.PRE, Tag.CODE, Tag.STYLE, Tag.SCRIPT, Tag.TEXTAREA},
+)
 
 
 def render_content(items: Content) -> str:
-    """Render the content of an HTML element."""
-    if isinstance(items, Primitive):
-        return str(items)
-    if isinstance(items, Iterable):
-        return "".join(render_content(x) for x in items)
+    """Render the content of an HTML element.
+
+    Walks the content tree iteratively with an explicit stack, so deeply
+    nested content costs no recursion or per-branch generators.
+    """
+    out: list[str] = []
+    append = out.append
+    stack: list[Content] = [items]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        x = pop()
+        t = type(x)
+        if t in _PRIM_TYPES or isinstance(x, Element):
+            append(str(x))
+        elif isinstance(x, str | bytes | int | float):
+            # Subclasses of the primitives miss the exact-type fast path.
+            append(str(x))
+        elif t in _ITERABLE_TYPES or isinstance(x, Iterable):
+            # Reversed so children pop off the stack in document order.
+            # mypy cannot narrow the exact-type check, hence the cast.
+            extend(reversed(list(cast("Iterable[Content]", x))))
+        else:
+            msg = f"Invalid content type: {type(x)}"
+            raise TypeError(msg)
+    return "".join(out)
+
+
+def render_content_bytes(items: Content) -> bytes:
+    """Render the content of an HTML element directly as UTF-8 bytes.
+
+    Same walk as render_content, but bytes leaves pass through without
+    re-encoding and everything else is encoded fragment by fragment.
+    """
+    out: list[bytes] = []
+    append = out.append
+    stack: list[Content] = [items]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        x = pop()
+        t = type(x)
+        if isinstance(x, bytes):
+            append(x)
+        elif isinstance(x, Element):
+            append(bytes(x))
+        elif t in _PRIM_TYPES:
+            append(str(x).encode())
+        elif isinstance(x, str | int | float):
+            # Subclasses of the primitives miss the exact-type fast path.
+            append(str(x).encode())
+        elif t in _ITERABLE_TYPES or isinstance(x, Iterable):
+            # Reversed so children pop off the stack in document order.
+            # mypy cannot narrow the exact-type check, hence the cast.
+            extend(reversed(list(cast("Iterable[Content]", x))))
+        else:
+            msg = f"Invalid content type: {type(x)}"
+            raise TypeError(msg)
+    return b"".join(out)
+
+
+class Slot:
+    """Placeholder for a dynamic leaf in a template meant for compile()."""
+
+    __slots__ = ()
 
-    msg = f"Invalid content type: {type(items)}"
-    raise TypeError(msg)
+    def __str__(self) -> str:
+        """Refuse to render; slots only receive values via compile()."""
+        msg = "Slot has no value; render it through a compiled template"
+        raise TypeError(msg)
+
+
+def _flatten(items: Content) -> "tuple[str | bytes | Element | Slot, ...]":
+    """Flatten a content tree into a tuple of leaf fragments.
+
+    Primitives are stringified up front so renders never revisit them;
+    elements (so their own caches stay live) and bytes (so the bytes
+    path can pass them through unencoded) are kept as-is.
+    """
+    out: list[str | bytes | Element | Slot] = []
+    append = out.append
+    stack: list[Content] = [items]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        x = pop()
+        t = type(x)
+        if isinstance(x, str | bytes):
+            append(x)
+        elif t in _PRIM_TYPES:
+            append(str(x))
+        elif isinstance(x, Slot | Element):
+            append(x)
+        elif isinstance(x, int | float):
+            # Subclasses of the primitives miss the exact-type fast path.
+            append(str(x))
+        elif t in _ITERABLE_TYPES or isinstance(x, Iterable):
+            # Reversed so children pop off the stack in document order.
+            extend(reversed(list(x)))
+        else:
+            msg = f"Invalid content type: {type(x)}"
+            raise TypeError(msg)
+    return tuple(out)
+
+
+# Attribute keys form a small repeating vocabulary; cache their stripped forms
+_NAME_CACHE: dict[str, str] = {}
+
+
+def _name(key: str) -> str:
+    """Strip trailing underscores from a keyword-safe attribute name."""
+    if key[-1] != "_":
+        return key
+    name = _NAME_CACHE.get(key)
+    if name is None:
+        name = _NAME_CACHE[key] = key.rstrip("_")
+    return name
+
+
+def _render_style(value: dict[str, str]) -> str:
+    """Render a style dict to a ``style="..."`` fragment with one join."""
+    parts = [' style="']
+    ap = parts.append
+    first = True
+    for k, v in value.items():
+        if not first:
+            ap(";")
+        ap(k)
+        ap(":")
+        ap(v if type(v) is str else str(v))
+        first = False
+    ap('"')
+    return "".join(parts)
 
 
 def render_attr(key: str, value: Attr) -> str:
     """Render an HTML attribute."""
-    name = key.rstrip("_")
+    name = _name(key)
 
     if value is True:
         return f" {name}"
     if value is False or value is None:
         return ""
     if name == "style" and isinstance(value, dict):
-        style_str = ";".join(f"{k}:{v}" for k, v in value.items())
-        return f' style="{style_str}"'
+        return _render_style(value)
     return f' {name}="{value}"'
 
 
+def _build_attrs_str(attrs: dict[str, Attr]) -> str:
+    """Render an attribute dict to its final string form.
+
+    The render_attr branches are inlined so that no function call is
+    paid per attribute.
+    """
+    parts: list[str] = []
+    ap = parts.append
+    for key, value in attrs.items():
+        if value is False or value is None:
+            continue
+        name = _name(key)
+        if value is True:
+            ap(" ")
+            ap(name)
+        elif name == "style" and isinstance(value, dict):
+            ap(_render_style(value))
+        else:
+            ap(f' {name}="{value}"')
+    return "".join(parts)
+
+
 class Element:
     """HTML element."""
 
+    __slots__ = (
+        "_attrs_str",
+        "_close",
+        "_flat_content",
+        "_open",
+        "_rendered",
+        "attrs",
+        "content",
+        "is_void",
+        "preserve_whitespace",
+        "tag",
+    )
+
     def __init__(
         self,
-        tag: Tag,
+        tag: str,
         *content: Content,
         void: bool = False,
         preserve_whitespace: bool = False,
@@ -132,15 +325,51 @@ class Element:
         self.preserve_whitespace = preserve_whitespace
         self.attrs = attrs
 
-        if tag in DEFAULT_ATTRS:
-            for k, v in DEFAULT_ATTRS[tag].items():
-                self.attrs.setdefault(k, v)
+        pairs = _DEFAULTS_PAIRS.get(tag)
+        if pairs is not None:
+            setdefault = self.attrs.setdefault
+            for k, v in pairs:
+                setdefault(k, v)
+
+        # Attrs and tag are fixed after construction, so render them once.
+        self._attrs_str = _build_attrs_str(self.attrs)
+        self._open = f"<{tag}"
+        self._close = f"</{tag}>"
 
         if void and content:
             msg = f"Void element <{tag}> cannot have content"
             raise ValueError(msg)
 
         self.content = content
+        # Flattened once here so renders never re-walk the nested tree.
+        self._flat_content = _flatten(content)
+        self._rendered: str | None = None
+
+    @classmethod
+    def _fast(  # noqa: PLR0913, PLR0917
+        cls,
+        tag: str,
+        content: tuple[Content, ...],
+        attrs: dict[str, Attr],
+        attrs_str: str,
+        open_tag: str,
+        close_tag: str,
+        *,
+        preserve_whitespace: bool = False,
+    ) -> Self:
+        """Construct an element from prebuilt fields, bypassing __init__."""
+        elem = cls.__new__(cls)
+        elem.tag = tag
+        elem.is_void = False
+        elem.preserve_whitespace = preserve_whitespace
+        elem.attrs = attrs
+        elem.content = content
+        elem._flat_content = _flatten(content)  # noqa: SLF001
+        elem._attrs_str = attrs_str  # noqa: SLF001
+        elem._open = open_tag  # noqa: SLF001
+        elem._close = close_tag  # noqa: SLF001
+        elem._rendered = None  # noqa: SLF001
+        return elem
 
     def __call__(self, *content: Content) -> Self:
         """Set the content of the element."""
@@ -148,30 +377,269 @@ class Element:
             msg = f"Void element <{self.tag}> cannot have content"
             raise ValueError(msg)
         self.content = content
+        self._flat_content = _flatten(content)
+        self._rendered = None
         return self
 
     def __str__(self) -> str:
-        """Render the element as a string."""
-        attrs_str = "".join(
-            render_attr(k, v) for k, v in self.attrs.items() if v not in (False, None)
-        )
+        """Render the element as a string.
+
+        The result is cached; calling the element with new content clears
+        the cache. Invalidation is strictly local: re-calling a nested
+        child does not clear the cache of an already-rendered ancestor,
+        and mutating ``self.attrs`` or ``self.content`` in place bypasses
+        the cache entirely, as attributes are rendered once in
+        ``__init__``.
+        """
+        if self._rendered is not None:
+            return self._rendered
+
+        # The joins are deliberate: one join over precomputed fragments
+        # beats re-formatting the tag into an f-string on every render.
+        if self.is_void:
+            rendered = "".join((self._open, self._attrs_str, "/>"))  # noqa: FLY002
+        elif not self.content:
+            rendered = "".join(  # noqa: FLY002
+                (self._open, self._attrs_str, ">", self._close),
+            )
+        else:
+            content_str = "".join(
+                x if type(x) is str else str(x) for x in self._flat_content
+            )
+            if self.preserve_whitespace:
+                rendered = "".join(  # noqa: FLY002
+                    (
+                        self._open,
+                        self._attrs_str,
+                        ">\n",
+                        content_str,
+                        "\n",
+                        self._close,
+                    ),
+                )
+            else:
+                rendered = "".join(  # noqa: FLY002
+                    (self._open, self._attrs_str, ">", content_str, self._close),
+                )
+
+        self._rendered = rendered
+        return rendered
+
+    def __bytes__(self) -> bytes:
+        """Render the element directly as UTF-8 bytes.
+
+        Consumers that ultimately need bytes (sockets, files, WSGI)
+        skip the full-document encode of str(self).encode(); bytes
+        content passes through without re-encoding.
+        """
+        open_b = self._open.encode()
+        attrs_b = self._attrs_str.encode()
 
         if self.is_void:
-            return f"<{self.tag}{attrs_str}/>"
+            return b"".join((open_b, attrs_b, b"/>"))
+
+        close_b = self._close.encode()
 
         if not self.content:
-            return f"<{self.tag}{attrs_str}></{self.tag}>"
+            return b"".join((open_b, attrs_b, b">", close_b))
+
+        content_parts: list[bytes] = []
+        for x in self._flat_content:
+            if isinstance(x, str):
+                content_parts.append(x.encode())
+            elif isinstance(x, bytes):
+                content_parts.append(x)
+            elif isinstance(x, Element):
+                content_parts.append(bytes(x))
+            else:
+                # an unfilled Slot raises its own TypeError via str()
+                content_parts.append(str(x).encode())
+        content_b = b"".join(content_parts)
 
-        content_str = render_content(self.content)
+        if self.preserve_whitespace:
+            return b"".join((open_b, attrs_b, b">\n", content_b, b"\n", close_b))
 
+        return b"".join((open_b, attrs_b, b">", content_b, close_b))
+
+    def write(self, out: Writable) -> None:
+        """Stream the rendered element to a writable text stream.
+
+        Fragments are written as they are produced, so peak memory is
+        proportional to tree depth rather than document size.
+        """
+        self._write(out.write)
+
+    def _write(self, w: Callable[[str], object]) -> None:
+        """Write this element's fragments through w."""
+        if self._rendered is not None:
+            w(self._rendered)
+            return
+
+        w(self._open)
+        w(self._attrs_str)
+
+        if self.is_void:
+            w("/>")
+            return
+
+        if not self.content:
+            w(">")
+            w(self._close)
+            return
+
+        w(">\n" if self.preserve_whitespace else ">")
+        for x in self._flat_content:
+            if isinstance(x, str):
+                w(x)
+            elif isinstance(x, Element):
+                x._write(w)  # noqa: SLF001
+            else:
+                # bytes keep their str() form; an unfilled Slot raises
+                # its own TypeError before anything more is written.
+                w(str(x))
         if self.preserve_whitespace:
-            return f"<{self.tag}{attrs_str}>\n{content_str}\n</{self.tag}>"
+            w("\n")
+        w(self._close)
+
+    def freeze(self) -> "_FrozenElement":
+        """Pre-render this element into a lightweight frozen snapshot.
+
+        Useful for static fragments embedded in many pages: the frozen
+        element renders by returning its cached string and can be used
+        as content anywhere a regular element can.
+        """
+        frozen = _FrozenElement.__new__(_FrozenElement)
+        frozen._s = str(self)  # noqa: SLF001
+        return frozen
+
+    # The codegen walk is one cohesive dispatch; splitting it would only
+    # scatter the branch logic, so the complexity warning is accepted.
+    def compile(self) -> Callable[..., str]:  # noqa: C901
+        """Compile this element into a specialized render function.
+
+        Walks the tree once and exec-compiles a function whose body is a
+        plain string build over the pre-rendered static fragments, with
+        one positional parameter per Slot in document order. Templates
+        re-rendered with varying leaves skip every attribute lookup and
+        branch of the interpreted render path.
+        """
+        exprs: list[str] = []
+        buf: list[str] = []
+        nslots = 0
+
+        def flush() -> None:
+            if buf:
+                exprs.append(repr("".join(buf)))
+                buf.clear()
+
+        def walk(e: Element) -> None:
+            nonlocal nslots
+            if isinstance(e, _FrozenElement):
+                buf.append(str(e))
+                return
+            buf.append(e._open)
+            buf.append(e._attrs_str)
+            if e.is_void:
+                buf.append("/>")
+                return
+            if not e.content:
+                # Mirror __str__: empty elements skip the whitespace branch.
+                buf.append(">")
+                buf.append(e._close)
+                return
+            buf.append(">\n" if e.preserve_whitespace else ">")
+            for x in e._flat_content:
+                if isinstance(x, str):
+                    buf.append(x)
+                elif isinstance(x, Slot):
+                    flush()
+                    exprs.append(f"str(a{nslots})")
+                    nslots += 1
+                elif isinstance(x, Element):
+                    walk(x)
+                else:
+                    buf.append(str(x))
+            if e.preserve_whitespace:
+                buf.append("\n")
+            buf.append(e._close)
+
+        walk(self)
+        flush()
+
+        args = ", ".join(f"a{i}" for i in range(nslots))
+        body = " + ".join(exprs) if exprs else "''"
+        src = f"def _compiled({args}):\n    return {body}\n"
+        namespace: dict[str, object] = {}
+        exec(src, namespace)  # noqa: S102
+        return cast("Callable[..., str]", namespace["_compiled"])
+
+
+class _FrozenElement(Element):
+    """A pre-rendered element that only carries its final string."""
+
+    __slots__ = ("_s",)
+
+    _s: str
+
+    def __call__(self, *content: Content) -> Self:  # noqa: ARG002
+        """Refuse new content; frozen elements are immutable snapshots."""
+        msg = "Frozen element is an immutable snapshot and cannot take content"
+        raise TypeError(msg)
 
-        return f"<{self.tag}{attrs_str}>{content_str}</{self.tag}>"
+    def __str__(self) -> str:
+        """Return the pre-rendered string."""
+        return self._s
+
+    def __bytes__(self) -> bytes:
+        """Return the pre-rendered string encoded as UTF-8."""
+        return self._s.encode()
+
+    def _write(self, w: Callable[[str], object]) -> None:
+        """Write the pre-rendered string through w."""
+        w(self._s)
+
+
+def bulk(tag: str, items: Iterable[Content], **attrs: Attr) -> list[Element]:
+    """Build one element per item, all sharing the same tag and attributes.
+
+    The default-attribute merge, attribute rendering and tag fragments
+    are computed once and shared, which dominates construction cost for
+    homogeneous children such as table rows or list items.
+
+    Sharing includes the attrs dict itself: every returned element holds
+    the same dict object, so treat it as read-only — mutating one
+    element's ``attrs`` aliases all its siblings (and is not reflected
+    in the pre-rendered attribute string either way).
+    """
+    if tag in _VOID_TAGS:
+        msg = f"Void element <{tag}> cannot have content"
+        raise ValueError(msg)
+
+    pairs = _DEFAULTS_PAIRS.get(tag)
+    if pairs is not None:
+        for k, v in pairs:
+            attrs.setdefault(k, v)
+
+    attrs_str = _build_attrs_str(attrs)
+    open_tag = f"<{tag}"
+    close_tag = f"</{tag}>"
+    preserve = tag in _PRESERVE_TAGS
+    return [
+        Element._fast(  # noqa: SLF001
+            tag,
+            (c,),
+            attrs,
+            attrs_str,
+            open_tag,
+            close_tag,
+            preserve_whitespace=preserve,
+        )
+        for c in items
+    ]
 
 
 def element(
-    tag: Tag,
+    tag: str,
     *,
     void: bool = False,
     preserve_whitespace: bool = False,
@@ -1,9 +1,47 @@
 """Testing the Element class."""
-from tinyhtml import Element, Tag
+from io import StringIO
+
+from tinyhtml import Element, Slot, Tag, bulk
 
 
 def test_element() -> None:
     """Test the Element class."""
     assert(
         str(Element(Tag.HTML, Element(Tag.BODY, Element(Tag.P, "Hello, world!")))) == "<html><body><p>Hello, world!</p></body></html>"
+    )
+
+
+def test_bytes() -> None:
+    """Test the bytes render path."""
+    assert bytes(Element(Tag.P, "Hello, world!")) == b"<p>Hello, world!</p>"
+
+
+def test_freeze() -> None:
+    """Test pre-rendering via freeze."""
+    frozen = Element(Tag.P, "hi").freeze()
+    assert str(Element(Tag.DIV, frozen)) == "<div><p>hi</p></div>"
+
+
+def test_write() -> None:
+    """Test streaming via write."""
+    buf = StringIO()
+    Element(Tag.DIV, Element(Tag.P, "hi")).write(buf)
+    assert buf.getvalue() == "<div><p>hi</p></div>"
+
+
+def test_compile() -> None:
+    """Test compiling a template with slots."""
+    render = Element(Tag.P, "Hello, ", Slot(), "!").compile()
+    assert render("world") == "<p>Hello, world!</p>"
+
+
+def test_zero_valued_attr() -> None:
+    """Test that a 0-valued attribute renders instead of being dropped."""
+    assert str(Element(Tag.TD, "x", colspan=0)) == '<td colspan="0">x</td>'
+
+
+def test_bulk() -> None:
+    """Test the bulk constructor."""
+    assert (
+        "".join(str(e) for e in bulk(Tag.TD, ["a", "b"], class_="cell")) == '<td class="cell">a</td><td class="cell">b</td>'
     )
\ No newline at end of file